@@ -2,12 +2,13 @@ from collections.abc import Generator
 from typing import Annotated
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
 from sqlmodel import Session
 
+from app.api.responses import prefers_msgpack
 from app.core import security
 from app.core.config import settings
 from app.core.db import engine
@@ -55,3 +56,10 @@ def get_current_active_superuser(current_user: CurrentUser) -> User:
             status_code=403, detail="The user doesn't have enough privileges"
         )
     return current_user
+
+
+def accepts_msgpack(request: Request) -> bool:
+    return prefers_msgpack(request.headers.get("accept", ""))
+
+
+AcceptsMsgPack = Annotated[bool, Depends(accepts_msgpack)]
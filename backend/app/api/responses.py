@@ -0,0 +1,71 @@
+from typing import Any
+
+import ormsgpack
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# OpenAPI entry advertising the MessagePack variant of a JSON response
+MSGPACK_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"content": {MSGPACK_MEDIA_TYPE: {}}}
+}
+
+
+def _media_range_quality(accept: str, media_type: str) -> float:
+    """
+    Quality the Accept header gives to a media type, from its most specific
+    matching range.
+    """
+    main_type = media_type.split("/")[0]
+    best_specificity, quality = -1, 0.0
+    for media_range in accept.split(","):
+        range_type, *params = (part.strip() for part in media_range.split(";"))
+        range_type = range_type.lower()
+        if range_type == media_type:
+            specificity = 2
+        elif range_type == f"{main_type}/*":
+            specificity = 1
+        elif range_type == "*/*":
+            specificity = 0
+        else:
+            continue
+        range_quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    range_quality = float(value)
+                except ValueError:
+                    range_quality = 0.0
+        if specificity > best_specificity:
+            best_specificity, quality = specificity, range_quality
+    return quality
+
+
+def prefers_msgpack(accept: str) -> bool:
+    msgpack_quality = _media_range_quality(accept, MSGPACK_MEDIA_TYPE)
+    json_quality = _media_range_quality(accept, "application/json")
+    # JSON stays the default when both are equally acceptable
+    return msgpack_quality > 0 and msgpack_quality > json_quality
+
+
+class MsgPackResponse(Response):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            content = content.model_dump(mode="python")
+        # ormsgpack encodes UUIDs and datetimes natively
+        return ormsgpack.packb(content)
+
+
+def negotiate_response(content: BaseModel, msgpack: bool) -> Response:
+    """
+    Render content as MessagePack or JSON, as negotiated from the Accept header.
+    """
+    # The representation depends on Accept, tell caches not to mix them
+    headers = {"Vary": "Accept"}
+    if msgpack:
+        return MsgPackResponse(content, headers=headers)
+    return ORJSONResponse(content.model_dump(mode="json"), headers=headers)
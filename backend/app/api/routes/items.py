@@ -4,15 +4,20 @@ from typing import Any
 from fastapi import APIRouter, HTTPException
 from sqlmodel import func, select
 
-from app.api.deps import CurrentUser, SessionDep
+from app.api.deps import AcceptsMsgPack, CurrentUser, SessionDep
+from app.api.responses import MSGPACK_RESPONSES, negotiate_response
 from app.models import Item, ItemCreate, ItemPublic, ItemsPublic, ItemUpdate, Message
 
 router = APIRouter(prefix="/items", tags=["items"])
 
 
-@router.get("/", response_model=ItemsPublic)
+@router.get("/", response_model=ItemsPublic, responses=MSGPACK_RESPONSES)
 def read_items(
-    session: SessionDep, current_user: CurrentUser, skip: int = 0, limit: int = 100
+    session: SessionDep,
+    current_user: CurrentUser,
+    accepts_msgpack: AcceptsMsgPack,
+    skip: int = 0,
+    limit: int = 100,
 ) -> Any:
     """
     Retrieve items.
@@ -38,7 +43,7 @@ def read_items(
         )
         items = session.exec(statement).all()
 
-    return ItemsPublic(data=items, count=count)
+    return negotiate_response(ItemsPublic(data=items, count=count), accepts_msgpack)
 
 
 @router.get("/{id}", response_model=ItemPublic)
@@ -6,10 +6,12 @@ from sqlmodel import col, delete, func, select
 
 from app import crud
 from app.api.deps import (
+    AcceptsMsgPack,
     CurrentUser,
     SessionDep,
     get_current_active_superuser,
 )
+from app.api.responses import MSGPACK_RESPONSES, negotiate_response
 from app.core.config import settings
 from app.core.security import get_password_hash, verify_password
 from app.models import (
@@ -33,8 +35,14 @@ router = APIRouter(prefix="/users", tags=["users"])
     "/",
     dependencies=[Depends(get_current_active_superuser)],
     response_model=UsersPublic,
+    responses=MSGPACK_RESPONSES,
 )
-def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
+def read_users(
+    session: SessionDep,
+    accepts_msgpack: AcceptsMsgPack,
+    skip: int = 0,
+    limit: int = 100,
+) -> Any:
     """
     Retrieve users.
     """
@@ -45,7 +53,7 @@ def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
     statement = select(User).offset(skip).limit(limit)
     users = session.exec(statement).all()
 
-    return UsersPublic(data=users, count=count)
+    return negotiate_response(UsersPublic(data=users, count=count), accepts_msgpack)
 
 
 @router.post(
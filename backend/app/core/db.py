@@ -4,7 +4,15 @@ from app import crud
 from app.core.config import settings
 from app.models import User, UserCreate
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+    # Reuse the most recently returned connection so idle ones can be recycled
+    pool_use_lifo=True,
+)
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
@@ -1,3 +1,6 @@
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -25,3 +28,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def get_password_hashes(passwords: Sequence[str]) -> list[str]:
+    if not passwords:
+        return []
+    # bcrypt releases the GIL while hashing, so one thread per core runs in parallel
+    max_workers = min(len(passwords), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(get_password_hash, passwords))
@@ -0,0 +1,60 @@
+import os
+import threading
+import time
+import uuid
+
+
+class UUID7Generator:
+    """
+    Time-ordered UUIDv7 (RFC 9562) generator.
+
+    Random bits are read from os.urandom in blocks instead of once per id, and a
+    12-bit counter keeps ids created within the same millisecond monotonic.
+    """
+
+    def __init__(self, buffer_size: int = 4096) -> None:
+        self._lock = threading.Lock()
+        self._buffer_size = buffer_size
+        self._buffer = b""
+        self._offset = 0
+        self._last_ms = 0
+        self._seq = 0
+
+    def _reset_after_fork(self) -> None:
+        # A forked child inherits the parent's unread random bytes, drop them so
+        # both processes don't hand out the same random bits
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._offset = 0
+
+    def _random_int(self, size: int) -> int:
+        if self._offset + size > len(self._buffer):
+            self._buffer = os.urandom(self._buffer_size)
+            self._offset = 0
+        chunk = self._buffer[self._offset : self._offset + size]
+        self._offset += size
+        return int.from_bytes(chunk, "big")
+
+    def __call__(self) -> uuid.UUID:
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                # Start in the lower half to leave room for the counter
+                self._seq = self._random_int(2) & 0x7FF
+            else:
+                self._seq += 1
+                if self._seq > 0xFFF:
+                    self._last_ms += 1
+                    self._seq = 0
+            timestamp = self._last_ms
+            seq = self._seq
+            rand_b = self._random_int(8) & 0x3FFF_FFFF_FFFF_FFFF
+        value = (timestamp << 80) | (0x7 << 76) | (seq << 64) | (0b10 << 62) | rand_b
+        return uuid.UUID(int=value)
+
+
+uuid7 = UUID7Generator()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=uuid7._reset_after_fork)
@@ -1,7 +1,9 @@
 import sentry_sdk
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from app.api.main import api_router
 from app.core.config import settings
@@ -18,6 +20,7 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    default_response_class=ORJSONResponse,
 )
 
 # Set all CORS enabled origins
@@ -30,4 +33,7 @@ if settings.all_cors_origins:
         allow_headers=["*"],
     )
 
+# Compress larger responses, e.g. paginated lists of users and items
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=6)
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
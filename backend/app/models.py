@@ -1,12 +1,50 @@
+import re
 import uuid
+from typing import Annotated
 
-from pydantic import EmailStr
+from pydantic import AfterValidator, GetJsonSchemaHandler, StringConstraints
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema
 from sqlmodel import Field, Relationship, SQLModel
 
+from app.core.uuid7 import uuid7
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def _validate_email(value: str) -> str:
+    if not _EMAIL_RE.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    # Domains are case-insensitive, normalize them like EmailStr does
+    local_part, _, domain = value.rpartition("@")
+    return f"{local_part}@{domain.lower()}"
+
+
+class _EmailJsonSchema:
+    def __get_pydantic_json_schema__(
+        self, core_schema: CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        json_schema = handler(core_schema)
+        json_schema["format"] = "email"
+        return json_schema
+
+
+# Lightweight replacement for EmailStr, which runs email-validator on every
+# instantiation; the schema still advertises the email format to clients
+Email = Annotated[str, AfterValidator(_validate_email), _EmailJsonSchema()]
+# Read-side counterpart for rows that were already validated on write
+EmailOut = Annotated[str, _EmailJsonSchema()]
+
+# Shared constraint aliases for API-only schemas, so the same core schema is
+# reused instead of rebuilt for every field. Table columns keep Field(max_length)
+# because SQLModel derives the VARCHAR length from it.
+Password = Annotated[str, StringConstraints(min_length=8, max_length=40)]
+Str255 = Annotated[str, StringConstraints(max_length=255)]
+
 
 # Shared properties
 class UserBase(SQLModel):
-    email: EmailStr = Field(unique=True, index=True, max_length=255)
+    email: Email = Field(unique=True, index=True, max_length=255)
     is_active: bool = True
     is_superuser: bool = False
     full_name: str | None = Field(default=None, max_length=255)
@@ -14,44 +52,49 @@ class UserBase(SQLModel):
 
 # Properties to receive via API on creation
 class UserCreate(UserBase):
-    password: str = Field(min_length=8, max_length=40)
+    password: Password
 
 
 class UserRegister(SQLModel):
-    email: EmailStr = Field(max_length=255)
-    password: str = Field(min_length=8, max_length=40)
-    full_name: str | None = Field(default=None, max_length=255)
+    email: Email = Field(max_length=255)
+    password: Password
+    full_name: Str255 | None = None
 
 
 # Properties to receive via API on update, all are optional
 class UserUpdate(UserBase):
-    email: EmailStr | None = Field(default=None, max_length=255)  # type: ignore
-    password: str | None = Field(default=None, min_length=8, max_length=40)
+    email: Email | None = Field(default=None, max_length=255)  # type: ignore
+    password: Password | None = None
 
 
 class UserUpdateMe(SQLModel):
-    full_name: str | None = Field(default=None, max_length=255)
-    email: EmailStr | None = Field(default=None, max_length=255)
+    full_name: Str255 | None = None
+    email: Email | None = Field(default=None, max_length=255)
 
 
 class UpdatePassword(SQLModel):
-    current_password: str = Field(min_length=8, max_length=40)
-    new_password: str = Field(min_length=8, max_length=40)
+    current_password: Password
+    new_password: Password
 
 
 # Database model, database table inferred from class name
 class User(UserBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
     hashed_password: str
     items: list["Item"] = Relationship(back_populates="owner", cascade_delete=True)
 
 
 # Properties to return via API, id is always required
 class UserPublic(UserBase):
+    model_config = {"frozen": True}
+
+    email: EmailOut = Field(max_length=255)
     id: uuid.UUID
 
 
 class UsersPublic(SQLModel):
+    model_config = {"frozen": True}
+
     data: list[UserPublic]
     count: int
 
@@ -74,41 +117,53 @@ class ItemUpdate(ItemBase):
 
 # Database model, database table inferred from class name
 class Item(ItemBase, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
     title: str = Field(max_length=255)
     owner_id: uuid.UUID = Field(
-        foreign_key="user.id", nullable=False, ondelete="CASCADE"
+        foreign_key="user.id", nullable=False, ondelete="CASCADE", index=True
     )
     owner: User | None = Relationship(back_populates="items")
 
 
 # Properties to return via API, id is always required
 class ItemPublic(ItemBase):
+    model_config = {"frozen": True}
+
     id: uuid.UUID
     owner_id: uuid.UUID
 
 
 class ItemsPublic(SQLModel):
+    model_config = {"frozen": True}
+
     data: list[ItemPublic]
     count: int
 
 
 # Generic message
 class Message(SQLModel):
+    model_config = {"frozen": True}
+
     message: str
 
 
 # JSON payload containing access token
 class Token(SQLModel):
+    model_config = {"frozen": True}
+
     access_token: str
     token_type: str = "bearer"
 
 
 # Contents of JWT token
 class TokenPayload(SQLModel):
+    model_config = {"frozen": True}
+
     sub: str | None = None
 
 
 class NewPassword(SQLModel):
+    model_config = {"frozen": True}
+
     token: str
-    new_password: str = Field(min_length=8, max_length=40)
+    new_password: Password
@@ -1,5 +1,6 @@
 import uuid
 
+import ormsgpack
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
@@ -79,6 +80,38 @@ def test_read_items(
     assert len(content["data"]) >= 2
 
 
+def test_read_items_msgpack(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    item = create_random_item(db)
+    response = client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers={**superuser_token_headers, "Accept": "application/msgpack"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/msgpack"
+    assert "Accept" in response.headers["vary"]
+    content = ormsgpack.unpackb(response.content)
+    assert content["count"] >= 1
+    assert str(item.id) in {data["id"] for data in content["data"]}
+
+
+def test_read_items_msgpack_refused(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/items/",
+        headers={
+            **superuser_token_headers,
+            "Accept": "application/msgpack;q=0, application/json",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert "Accept" in response.headers["vary"]
+    assert "data" in response.json()
+
+
 def test_update_item(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
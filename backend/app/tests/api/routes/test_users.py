@@ -1,6 +1,7 @@
 import uuid
 from unittest.mock import patch
 
+import ormsgpack
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
@@ -168,6 +169,23 @@ def test_retrieve_users(
         assert "email" in item
 
 
+def test_retrieve_users_msgpack(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/users/",
+        headers={**superuser_token_headers, "Accept": "application/msgpack"},
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/msgpack"
+    assert "Accept" in r.headers["vary"]
+    all_users = ormsgpack.unpackb(r.content)
+    assert all_users["count"] >= 1
+    for item in all_users["data"]:
+        assert "email" in item
+        assert "hashed_password" not in item
+
+
 def test_update_user_me(
     client: TestClient, normal_user_token_headers: dict[str, str], db: Session
 ) -> None:
@@ -2,6 +2,9 @@ from collections.abc import Generator
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, raiseload
+from sqlalchemy.orm import Session as ORMSession
 from sqlmodel import Session, delete
 
 from app.core.config import settings
@@ -12,6 +15,28 @@ from app.tests.utils.user import authentication_token_from_email
 from app.tests.utils.utils import get_superuser_token_headers
 
 
+@event.listens_for(ORMSession, "do_orm_execute")
+def raise_on_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    # Relationships not loaded explicitly with .options(...) raise instead of
+    # silently emitting a SELECT per row, so N+1 queries fail the tests.
+    # The wildcard would also override eager strategies set on the mapper
+    # (lazy="selectin", "joined", ...), so statements whose entities declare
+    # one are left alone rather than behave differently than in production.
+    if not orm_execute_state.is_select or (
+        orm_execute_state.is_column_load or orm_execute_state.is_relationship_load
+    ):
+        return
+    if any(
+        relationship.lazy != "select"
+        for mapper in orm_execute_state.all_mappers
+        for relationship in mapper.relationships
+    ):
+        return
+    orm_execute_state.statement = orm_execute_state.statement.options(
+        raiseload("*", sql_only=True)
+    )
+
+
 @pytest.fixture(scope="session", autouse=True)
 def db() -> Generator[Session, None, None]:
     with Session(engine) as session:
@@ -0,0 +1,15 @@
+from app.core.security import get_password_hashes, verify_password
+from app.tests.utils.utils import random_lower_string
+
+
+def test_get_password_hashes() -> None:
+    passwords = [random_lower_string() for _ in range(3)]
+    hashed_passwords = get_password_hashes(passwords)
+    assert len(hashed_passwords) == len(passwords)
+    for password, hashed_password in zip(passwords, hashed_passwords, strict=True):
+        assert verify_password(password, hashed_password)
+    assert not verify_password(passwords[0], hashed_passwords[1])
+
+
+def test_get_password_hashes_empty() -> None:
+    assert get_password_hashes([]) == []
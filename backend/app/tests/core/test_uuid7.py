@@ -0,0 +1,65 @@
+import os
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from app.core.uuid7 import UUID7Generator, uuid7
+
+FIXED_TIME_NS = 1_700_000_000_000 * 1_000_000
+
+
+def timestamp_ms(value: uuid.UUID) -> int:
+    return value.int >> 80
+
+
+def test_uuid7_version_and_variant() -> None:
+    value = UUID7Generator()()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_monotonic_within_same_millisecond() -> None:
+    generator = UUID7Generator()
+    with patch("app.core.uuid7.time.time_ns", return_value=FIXED_TIME_NS):
+        ids = [generator() for _ in range(1000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert {timestamp_ms(i) for i in ids} == {FIXED_TIME_NS // 1_000_000}
+
+
+def test_uuid7_counter_overflow_advances_timestamp() -> None:
+    generator = UUID7Generator()
+    # The counter has 12 bits, so this many ids cannot fit in one millisecond
+    with patch("app.core.uuid7.time.time_ns", return_value=FIXED_TIME_NS):
+        ids = [generator() for _ in range(5000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert timestamp_ms(ids[-1]) > FIXED_TIME_NS // 1_000_000
+    assert all(i.version == 7 and i.variant == uuid.RFC_4122 for i in ids)
+
+
+def test_uuid7_monotonic_when_clock_goes_backwards() -> None:
+    generator = UUID7Generator()
+    with patch("app.core.uuid7.time.time_ns", return_value=FIXED_TIME_NS):
+        first = generator()
+    with patch("app.core.uuid7.time.time_ns", return_value=FIXED_TIME_NS - 10**9):
+        second = generator()
+    assert second > first
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_uuid7_forked_child_does_not_reuse_random_bits() -> None:
+    uuid7()  # Make sure the parent has buffered random bytes
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, uuid7().bytes)
+        os._exit(0)
+    os.close(write_fd)
+    child_id = uuid.UUID(bytes=os.read(read_fd, 16))
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    parent_id = uuid7()
+    assert child_id.int & 0x3FFF_FFFF_FFFF_FFFF != parent_id.int & 0x3FFF_FFFF_FFFF_FFFF
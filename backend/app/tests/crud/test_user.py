@@ -1,9 +1,14 @@
+import pytest
 from fastapi.encoders import jsonable_encoder
-from sqlmodel import Session
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select
 
 from app import crud
+from app.core.db import engine
 from app.core.security import verify_password
 from app.models import User, UserCreate, UserUpdate
+from app.tests.utils.item import create_random_item
 from app.tests.utils.utils import random_email, random_lower_string
 
 
@@ -89,3 +94,20 @@ def test_update_user(db: Session) -> None:
     assert user_2
     assert user.email == user_2.email
     assert verify_password(new_password, user_2.hashed_password)
+
+
+def test_lazy_load_raises(db: Session) -> None:
+    item = create_random_item(db)
+    with Session(engine) as session:
+        user = session.get(User, item.owner_id)
+        assert user
+        with pytest.raises(InvalidRequestError):
+            _ = user.items
+    with Session(engine) as session:
+        statement = (
+            select(User)
+            .where(User.id == item.owner_id)
+            .options(selectinload(User.items))  # type: ignore[arg-type]
+        )
+        user = session.exec(statement).one()
+        assert [i.id for i in user.items] == [item.id]
@@ -0,0 +1,21 @@
+import pytest
+from pydantic import ValidationError
+
+from app.models import User, UserCreate
+
+
+def test_user_email_column_is_unique_and_indexed() -> None:
+    email_column = User.__table__.c.email  # type: ignore[attr-defined]
+    assert email_column.unique
+    assert email_column.index
+
+
+@pytest.mark.parametrize("email", ["not-an-email", "foo@example.com\n"])
+def test_user_create_rejects_malformed_email(email: str) -> None:
+    with pytest.raises(ValidationError):
+        UserCreate(email=email, password="changethis")
+
+
+def test_user_create_normalizes_email_domain() -> None:
+    user_in = UserCreate(email="Foo@Example.COM", password="changethis")
+    assert user_in.email == "Foo@example.com"